@@ -0,0 +1,74 @@
+""" test global hotkey key mapping """
+
+# pylint: disable=protected-access
+
+import logging
+from types import SimpleNamespace
+
+import whisperflow.gui.global_hotkey as gh
+
+
+FAKE_ECODES = SimpleNamespace(
+    KEY_F9=67,
+    KEY_F12=88,
+    KEY_ESC=1,
+    KEY_SPACE=57,
+    KEY_SYSRQ=99,
+    KEY_A=30,
+    KEY_5=6,
+)
+
+
+def use_fake_ecodes(monkeypatch):
+    """map names through a fixed table whether or not evdev is installed"""
+    monkeypatch.setattr(gh, "EVDEV_AVAILABLE", True)
+    monkeypatch.setattr(gh, "ecodes", FAKE_ECODES, raising=False)
+
+
+def test_gdk_name_to_evdev_special_keys(monkeypatch):
+    """GDK names of non-character keys map to their KEY_* codes"""
+    use_fake_ecodes(monkeypatch)
+    assert gh._gdk_name_to_evdev("F9") == 67
+    assert gh._gdk_name_to_evdev("F12") == 88
+    assert gh._gdk_name_to_evdev("Escape") == 1
+    assert gh._gdk_name_to_evdev("space") == 57
+    assert gh._gdk_name_to_evdev("Print") == 99
+
+
+def test_gdk_name_to_evdev_characters(monkeypatch):
+    """letters (either case) and digits map by key position"""
+    use_fake_ecodes(monkeypatch)
+    assert gh._gdk_name_to_evdev("a") == 30
+    assert gh._gdk_name_to_evdev("A") == 30
+    assert gh._gdk_name_to_evdev("5") == 6
+
+
+def test_gdk_name_to_evdev_unmapped(monkeypatch):
+    """unknown names, punctuation and a missing evdev give None"""
+    use_fake_ecodes(monkeypatch)
+    assert gh._gdk_name_to_evdev("F13") is None
+    assert gh._gdk_name_to_evdev("Menu") is None
+    assert gh._gdk_name_to_evdev("é") is None
+    assert gh._gdk_name_to_evdev(";") is None
+
+    monkeypatch.setattr(gh, "EVDEV_AVAILABLE", False)
+    assert gh._gdk_name_to_evdev("F9") is None
+
+
+def test_set_hotkey_warns_only_when_no_backend_maps_key(monkeypatch, caplog):
+    """a key evdev handles is not reported as unmapped for lack of pynput"""
+    use_fake_ecodes(monkeypatch)
+    monkeypatch.setattr(gh, "PYNPUT_AVAILABLE", False)
+    monkeypatch.setattr(gh._EvdevBackend, "start", lambda self: True)
+    monkeypatch.setattr(gh._EvdevBackend, "stop", lambda self: None)
+    hotkey = gh.GlobalHotkey()
+
+    with caplog.at_level(logging.WARNING, logger=gh.__name__):
+        hotkey.set_hotkey("F9", lambda: None)
+        assert hotkey._evdev is not None
+        assert not caplog.records
+
+        hotkey.set_hotkey("Menu", lambda: None)
+    assert [record.getMessage() for record in caplog.records] == [
+        "Could not map key 'Menu' to a global hotkey"
+    ]
@@ -0,0 +1,65 @@
+""" test settings loading """
+
+# pylint: disable=protected-access
+
+import os
+import json
+
+import pytest
+
+# settings.py pulls in GTK 4 / libadwaita through gi at import
+try:
+    import whisperflow.gui.settings as gs
+except (ImportError, ValueError) as exc:
+    pytest.skip(f"GTK 4 bindings unavailable: {exc}", allow_module_level=True)
+
+
+@pytest.fixture(name="config_file")
+def fixture_config_file(tmp_path, monkeypatch):
+    """point the settings module at an empty cache and a temp file"""
+    path = tmp_path / "settings.json"
+    monkeypatch.setattr(gs, "CONFIG_FILE", str(path))
+    monkeypatch.setitem(gs._SETTINGS_CACHE, "mtime", None)
+    monkeypatch.setitem(gs._SETTINGS_CACHE, "data", None)
+    return path
+
+
+def count_json_loads(monkeypatch):
+    """wrap json.load to count how often the file is parsed"""
+    calls = []
+    original = json.load
+
+    def load(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(gs.json, "load", load)
+    return calls
+
+
+def test_load_settings_defaults(config_file):
+    """a missing file gives the defaults"""
+    assert not config_file.exists()
+    assert gs.load_settings() == gs.DEFAULT_SETTINGS
+
+
+def test_load_settings_cached_by_mtime(config_file, monkeypatch):
+    """an unchanged file is parsed once; a rewritten one is parsed again"""
+    config_file.write_text(json.dumps({"model": "base.en"}))
+    os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+    loads = count_json_loads(monkeypatch)
+
+    first = gs.load_settings()
+    second = gs.load_settings()
+    assert first["model"] == second["model"] == "base.en"
+    assert first["hotkey"] == gs.DEFAULT_SETTINGS["hotkey"]
+    assert len(loads) == 1
+
+    # callers get their own copy to mutate
+    first["model"] = "large"
+    assert gs.load_settings()["model"] == "base.en"
+
+    config_file.write_text(json.dumps({"model": "small.en"}))
+    os.utime(config_file, ns=(2_000_000_000, 2_000_000_000))
+    assert gs.load_settings()["model"] == "small.en"
+    assert len(loads) == 2
@@ -0,0 +1,310 @@
+""" test transcription engine """
+
+# pylint: disable=protected-access,wrong-import-position
+
+import sys
+import types
+
+import numpy as np
+
+
+def _ensure_module(name, **attrs):
+    """import a heavy dependency, or stand in for it if it isn't installed;
+    the logic under test never calls into torch or whisper"""
+    try:
+        __import__(name)
+    except ImportError:
+        module = types.ModuleType(name)
+        module.__dict__.update(attrs)
+        sys.modules[name] = module
+
+
+_ensure_module("torch")
+_ensure_module("whisper", Whisper=object)
+
+import whisperflow.gui.transcription_engine as te  # noqa: E402
+
+
+def make_engine(ring_size=None):
+    """engine with an optionally smaller ring"""
+    engine = te.TranscriptionEngine()
+    if ring_size is not None:
+        engine._ring = np.zeros(ring_size, np.int16)
+    return engine
+
+
+def ring_contents(engine):
+    """samples currently held in the ring"""
+    return engine._ring[: engine._ring_len].tolist()
+
+
+def test_ring_append():
+    """appends in order until the ring is full"""
+    engine = make_engine(ring_size=8)
+    engine._ring_append(np.arange(3, dtype=np.int16))
+    engine._ring_append(np.arange(3, 6, dtype=np.int16))
+    assert ring_contents(engine) == [0, 1, 2, 3, 4, 5]
+
+
+def test_ring_append_overflow():
+    """drops the oldest samples once the ring is full"""
+    engine = make_engine(ring_size=8)
+    engine._ring_append(np.arange(6, dtype=np.int16))
+    engine._ring_append(np.arange(6, 11, dtype=np.int16))
+    assert ring_contents(engine) == [3, 4, 5, 6, 7, 8, 9, 10]
+
+
+def test_ring_append_larger_than_ring():
+    """a chunk longer than the ring keeps only its newest samples"""
+    engine = make_engine(ring_size=4)
+    engine._ring_append(np.arange(2, dtype=np.int16))
+    engine._ring_append(np.arange(10, dtype=np.int16))
+    assert ring_contents(engine) == [6, 7, 8, 9]
+
+
+def test_ring_consume():
+    """drops the oldest samples and keeps the rest in order"""
+    engine = make_engine(ring_size=8)
+    engine._ring_append(np.arange(6, dtype=np.int16))
+    engine._ring_consume(4)
+    assert ring_contents(engine) == [4, 5]
+    engine._ring_consume(10)
+    assert ring_contents(engine) == []
+
+
+def test_count_final_words():
+    """words ending COMMIT_LAG_SECONDS before the buffer end are final"""
+    words = [(" one", 0.3), (" two", 0.9), (" three", 1.4)]
+    assert te._count_final_words(words, 1.0) == 1
+    assert te._count_final_words(words, 1.3) == 2
+    assert te._count_final_words(words, 2.0) == 3
+    assert te._count_final_words([], 2.0) == 0
+
+
+class ChunkFeed:
+    """audio queue that hands the loop one chunk per get(), so every
+    chunk gets its own tick"""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    def get(self, timeout=None):  # pylint: disable=unused-argument
+        """next chunk; None (the stop sentinel) once exhausted"""
+        return self._chunks.pop(0) if self._chunks else None
+
+    def get_nowait(self):
+        """never more than one chunk at a time"""
+        raise te.queue.Empty
+
+
+def run_loop(monkeypatch, chunks, replies):
+    """run _transcribe_loop over *chunks*, answering each decode with the
+    next entry of *replies*; returns (transcripts, decoded lengths)"""
+    monkeypatch.setattr(te, "TRANSCRIBE_INTERVAL", 0)
+    engine = make_engine()
+    transcripts, decoded = [], []
+    engine.connect_transcript(lambda partial, text: transcripts.append((partial, text)))
+    engine._wait_for_model = lambda _stop_event: True
+    replies = list(replies)
+
+    def transcribe(arr, _prompt):
+        decoded.append(len(arr))
+        return replies.pop(0)
+
+    engine._transcribe = transcribe
+    stop_event = te.threading.Event()
+    assert engine._transcribe_loop(stop_event, ChunkFeed(chunks))
+    return engine, transcripts, decoded
+
+
+HALF_SECOND = te.SAMPLE_RATE // 2
+
+
+def voiced():
+    """half a second of loud audio"""
+    return np.full(HALF_SECOND, 8000, np.int16)
+
+
+def silent():
+    """half a second of silence"""
+    return np.zeros(HALF_SECOND, np.int16)
+
+
+def test_transcribe_loop_commits_by_timestamp(monkeypatch):
+    """commits settled words, slices them off and shows the rest as partial"""
+    engine, transcripts, decoded = run_loop(
+        monkeypatch,
+        [voiced(), voiced(), voiced()],
+        [
+            [(" hello", 0.05)],
+            [(" big", 0.5), (" world", 0.9)],
+            [(" world", 0.4), (" again", 0.9)],
+        ],
+    )
+    assert transcripts == [
+        (False, "hello"),
+        (False, "big"),
+        (True, "world"),
+        (False, "world"),
+        (True, "again"),
+        (False, "again"),
+        (False, None),
+    ]
+    # each commit slices its audio off before the next pass:
+    # 0.05 s for "hello", then 0.5 s for "big", then 0.4 s for "world"
+    assert decoded == [HALF_SECOND, 2 * HALF_SECOND - 800, 2 * HALF_SECOND - 800]
+    assert engine._ring_len == 3 * HALF_SECOND - 800 - 8000 - 6400
+
+
+def test_transcribe_loop_flushes_tail_on_stop(monkeypatch):
+    """audio that arrived after the last pass is decoded and committed
+    when recording stops"""
+    _engine, transcripts, decoded = run_loop(
+        monkeypatch,
+        [voiced(), voiced()[: te.CHUNK_FRAMES]],
+        [[(" hello", 0.05)], [(" world", 0.5)]],
+    )
+    assert decoded == [HALF_SECOND, HALF_SECOND - 800 + te.CHUNK_FRAMES]
+    assert transcripts == [(False, "hello"), (False, "world"), (False, None)]
+
+
+def test_transcribe_loop_waits_for_voiced_audio_after_commit(monkeypatch):
+    """silence after a commit is not decoded; undecided words it follows
+    are committed as they stand"""
+    engine, transcripts, decoded = run_loop(
+        monkeypatch,
+        [voiced(), silent(), silent()],
+        [[(" one", 0.05), (" two", 0.45)]],
+    )
+    assert decoded == [HALF_SECOND]
+    assert transcripts == [
+        (False, "one"),
+        (True, "two"),
+        (False, "two"),
+        (False, None),
+    ]
+    # the pause that followed was dropped but for the pre-roll
+    assert engine._ring_len == int(te.SAMPLE_RATE * te.PRE_ROLL_SECONDS)
+
+
+def test_transcribe_loop_decodes_after_an_interval_of_blocks(monkeypatch):
+    """with audio arriving in capture blocks, a pass runs as soon as one
+    interval's worth of whole blocks follows a commit"""
+    block = np.full(te.CHUNK_FRAMES, 8000, np.int16)
+    blocks_per_pass = te.MIN_DECODE_SAMPLES // te.CHUNK_FRAMES
+    _engine, transcripts, decoded = run_loop(
+        monkeypatch,
+        [block] * (2 * blocks_per_pass),
+        [[(" hi", 0.04)], []],
+    )
+    assert te.MIN_DECODE_SAMPLES == 7 * te.CHUNK_FRAMES
+    assert decoded == [
+        te.MIN_DECODE_SAMPLES,
+        2 * te.MIN_DECODE_SAMPLES - 640,
+    ]
+    assert transcripts == [(False, "hi"), (False, None)]
+
+
+def test_transcribe_loop_skips_leading_silence(monkeypatch):
+    """silence before any speech is never decoded, nor kept for the next
+    voiced pass"""
+    _engine, transcripts, decoded = run_loop(
+        monkeypatch,
+        [silent()] * 15 + [voiced()],
+        [[(" hello", 0.6)]],
+    )
+    assert decoded == [int(te.SAMPLE_RATE * te.PRE_ROLL_SECONDS) + HALF_SECOND]
+    assert transcripts == [(True, "hello"), (False, "hello"), (False, None)]
+
+
+def test_transcribe_loop_keeps_edge_word_at_segment_cap(monkeypatch):
+    """a full segment with nothing settled commits all but the word at
+    the buffer edge, and slices only the committed audio off"""
+    monkeypatch.setattr(te, "SEGMENT_MAX_SECONDS", 1)
+    engine, transcripts, decoded = run_loop(
+        monkeypatch,
+        [voiced(), voiced()],
+        [[(" hi", 0.4)], [(" hi", 0.7), (" there", 0.95)]],
+    )
+    assert decoded == [HALF_SECOND, 2 * HALF_SECOND]
+    assert transcripts == [
+        (True, "hi"),
+        (False, "hi"),
+        (True, "there"),
+        (False, "there"),
+        (False, None),
+    ]
+    assert engine._ring_len == 2 * HALF_SECOND - int(0.7 * te.SAMPLE_RATE)
+
+
+def test_route_final_text_builds_clipboard_utterance(monkeypatch):
+    """the clipboard holds the whole segment, not only the last commit"""
+    copied = []
+    monkeypatch.setattr(te, "set_clipboard", copied.append)
+    engine = make_engine()
+    engine.set_auto_clipboard(True)
+
+    engine._route_final_text("hello there")
+    engine._route_final_text("world", continues=True)
+    assert copied == ["hello there", "hello there world"]
+
+    engine._end_segment()
+    engine._route_final_text("again", continues=True)
+    assert copied[-1] == "again"
+
+
+def test_put_dropping_oldest():
+    """a full queue drops its oldest item instead of raising"""
+    audio_queue = te.queue.Queue(maxsize=2)
+    for item in (1, 2, 3):
+        te._put_dropping_oldest(audio_queue, item)
+    assert [audio_queue.get_nowait(), audio_queue.get_nowait()] == [2, 3]
+
+
+def test_preload_waits_for_settings(monkeypatch):
+    """constructing the engine loads nothing; preload() loads the model
+    chosen by the settings, once"""
+    loads = []
+    monkeypatch.setattr(
+        te.TranscriptionEngine,
+        "_load_model",
+        lambda self: loads.append(self._model_name),
+    )
+    engine = make_engine()
+    engine.set_offline(True)
+    engine.set_model("base.en")
+    assert engine._load_thread is None
+
+    engine.preload()
+    engine._load_thread.join()
+    engine.preload()
+    engine._load_thread.join()
+    assert loads == ["base.en"]
+
+
+def test_wait_for_model_pauses_capture_on_stop():
+    """stopping while the model loads pauses the microphone right away"""
+    engine = make_engine()
+    engine._model = object()
+    loaded = te.threading.Event()
+    engine._load_thread = te.threading.Thread(target=loaded.wait)
+    engine._load_thread.start()
+    stops = []
+    engine._stream = types.SimpleNamespace(stop_stream=lambda: stops.append(1))
+    engine._capture_queue = te.queue.Queue()
+
+    stop_event = te.threading.Event()
+    stop_event.set()
+    waiter = te.threading.Thread(target=engine._wait_for_model, args=(stop_event,))
+    waiter.start()
+    for _ in range(100):
+        if stops:
+            break
+        te.time.sleep(0.01)
+    assert stops == [1]
+    assert engine._capture_queue is None
+    assert waiter.is_alive()
+
+    loaded.set()
+    waiter.join()
+    assert stops == [1]
@@ -0,0 +1,98 @@
+""" test window tracker """
+
+# pylint: disable=protected-access
+
+import subprocess
+
+import whisperflow.gui.window_tracker as wt
+
+
+SHELL_GEOMETRY = "WINDOW=94371847\nX=10\nY=20\nWIDTH=800\nHEIGHT=600\nSCREEN=0\n"
+
+
+def fake_run(returncode=0, stdout="", exc=None):
+    """subprocess.run stand-in that records the command it was given"""
+    calls = []
+
+    def run(args, **_kwargs):
+        calls.append(args)
+        if exc is not None:
+            raise exc
+        return subprocess.CompletedProcess(args, returncode, stdout=stdout)
+
+    run.calls = calls
+    return run
+
+
+def test_xdotool_snapshot(monkeypatch):
+    """parses id, name and pid from one chained xdotool run"""
+    run = fake_run(stdout=SHELL_GEOMETRY + "Terminal — bash\n4242\n")
+    monkeypatch.setattr(wt.subprocess, "run", run)
+    assert wt._xdotool_snapshot() == ("94371847", "Terminal — bash", "4242")
+    assert len(run.calls) == 1
+
+
+def test_xdotool_snapshot_without_pid(monkeypatch):
+    """getwindowpid fails without _NET_WM_PID; keep what was printed"""
+    run = fake_run(returncode=1, stdout=SHELL_GEOMETRY + "Terminal\n")
+    monkeypatch.setattr(wt.subprocess, "run", run)
+    assert wt._xdotool_snapshot() == ("94371847", "Terminal", None)
+
+
+def test_xdotool_snapshot_no_window(monkeypatch):
+    """no active window prints nothing"""
+    monkeypatch.setattr(wt.subprocess, "run", fake_run(returncode=1))
+    assert wt._xdotool_snapshot() == (None, None, None)
+
+
+def test_xdotool_snapshot_timeout(monkeypatch):
+    """a stuck X server gives up after the query timeout"""
+    exc = subprocess.TimeoutExpired(["xdotool"], wt.QUERY_TIMEOUT)
+    monkeypatch.setattr(wt.subprocess, "run", fake_run(exc=exc))
+    assert wt._xdotool_snapshot() == (None, None, None)
+
+
+def test_get_window_name_queries_given_window(monkeypatch):
+    """asks for the requested window, not the active one"""
+    run = fake_run(stdout="Editor\n")
+    monkeypatch.setattr(wt.subprocess, "run", run)
+    assert wt.get_window_name("123") == "Editor"
+    assert run.calls == [["xdotool", "getwindowname", "123"]]
+    assert wt.get_window_name("not-an-id") is None
+    assert len(run.calls) == 1
+
+
+def test_focus_window_skips_reactivating_active_window(monkeypatch):
+    """a window activated moments ago and still active isn't re-activated"""
+    actions = []
+    monkeypatch.setattr(wt, "_run_action", lambda args: actions.append(args) or "")
+    monkeypatch.setattr(wt, "_active_window_id", lambda: "123")
+    monkeypatch.setitem(wt._LAST_ACTIVATED, "id", None)
+
+    assert wt.focus_window("123")
+    assert wt.focus_window("123")
+    assert len(actions) == 1
+
+
+def test_focus_window_reactivates_after_focus_change(monkeypatch):
+    """the user switched windows since; activate the target again"""
+    actions = []
+    monkeypatch.setattr(wt, "_run_action", lambda args: actions.append(args) or "")
+    monkeypatch.setattr(wt, "_active_window_id", lambda: "456")
+    monkeypatch.setitem(wt._LAST_ACTIVATED, "id", None)
+
+    assert wt.focus_window("123")
+    assert wt.focus_window("123")
+    assert len(actions) == 2
+
+
+def test_paste_text_targets_window_after_key(monkeypatch):
+    """--window is an option of the key command, so it follows it"""
+    actions = []
+    monkeypatch.setattr(wt, "get_clipboard", lambda: None)
+    monkeypatch.setattr(wt, "set_clipboard", lambda text: True)
+    monkeypatch.setattr(wt, "_run_action", lambda args: actions.append(args) or "")
+    assert wt.paste_text("hello", window_id="123")
+    assert actions == [
+        ["xdotool", "key", "--window", "123", "--clearmodifiers", wt.PASTE_KEYS]
+    ]
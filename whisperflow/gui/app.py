@@ -32,6 +32,11 @@ class WhisperFlowApp(Adw.Application):
         Adw.Application.do_startup(self)
         self._setup_actions()
 
+    def do_shutdown(self):
+        if self.window:
+            self.window.shutdown()
+        Adw.Application.do_shutdown(self)
+
     def _setup_actions(self):
         quit_action = Gio.SimpleAction.new("quit", None)
         quit_action.connect("activate", lambda *_: self.quit())
@@ -1,11 +1,14 @@
-"""System-wide global hotkey listener using pynput.
+"""System-wide global hotkey listener using evdev or pynput.
 
 Runs a background keyboard listener that fires a callback when
 the configured hotkey is pressed, regardless of which application
-has focus.
+has focus.  Keyboards are read straight from /dev/input with evdev when
+the user has access to them; otherwise pynput's X11 listener is used.
 """
 
 import logging
+import os
+import select
 import threading
 
 log = logging.getLogger(__name__)
@@ -16,7 +19,17 @@ try:
     PYNPUT_AVAILABLE = True
 except ImportError:
     PYNPUT_AVAILABLE = False
-    log.warning("pynput not installed — global hotkey disabled")
+
+try:
+    import evdev
+    from evdev import ecodes
+
+    EVDEV_AVAILABLE = True
+except ImportError:
+    EVDEV_AVAILABLE = False
+
+if not PYNPUT_AVAILABLE and not EVDEV_AVAILABLE:
+    log.warning("Neither evdev nor pynput installed — global hotkey disabled")
 
 
 # Map common GDK key names to pynput Key attrs
@@ -35,15 +48,54 @@ _SPECIAL_KEYS = {
 }
 
 
+# Resolved once at import: GDK key name -> pynput Key
+_SPECIAL_KEYS_RESOLVED = (
+    {
+        name: getattr(keyboard.Key, attr, None)
+        for name, attr in _SPECIAL_KEYS.items()
+    }
+    if PYNPUT_AVAILABLE
+    else {}
+)
+
+
+# Map the same GDK key names to evdev KEY_* codes
+_EVDEV_SPECIAL_KEYS = {
+    **{f"F{n}": f"KEY_F{n}" for n in range(1, 13)},
+    "Escape": "KEY_ESC", "Return": "KEY_ENTER", "space": "KEY_SPACE",
+    "Tab": "KEY_TAB", "BackSpace": "KEY_BACKSPACE", "Delete": "KEY_DELETE",
+    "Home": "KEY_HOME", "End": "KEY_END",
+    "Page_Up": "KEY_PAGEUP", "Page_Down": "KEY_PAGEDOWN",
+    "Insert": "KEY_INSERT",
+    "Pause": "KEY_PAUSE", "Scroll_Lock": "KEY_SCROLLLOCK",
+    "Print": "KEY_SYSRQ",
+    "Caps_Lock": "KEY_CAPSLOCK", "Num_Lock": "KEY_NUMLOCK",
+}
+
+
+def _gdk_name_to_evdev(key_name):
+    """Convert a GDK key name to an evdev key code, or None.
+
+    Letters and digits map by their position on a US layout, since evdev
+    reports physical keys rather than symbols.
+    """
+    if not EVDEV_AVAILABLE:
+        return None
+    if key_name in _EVDEV_SPECIAL_KEYS:
+        return getattr(ecodes, _EVDEV_SPECIAL_KEYS[key_name], None)
+    if len(key_name) == 1 and key_name.isalnum() and key_name.isascii():
+        return getattr(ecodes, f"KEY_{key_name.upper()}", None)
+    return None
+
+
 def _gdk_name_to_pynput(key_name):
     """Convert a GDK key name (e.g. 'F9', 'a') to a pynput key object."""
     if not PYNPUT_AVAILABLE:
         return None
 
     # Check special keys first
-    if key_name in _SPECIAL_KEYS:
-        attr = _SPECIAL_KEYS[key_name]
-        return getattr(keyboard.Key, attr, None)
+    if key_name in _SPECIAL_KEYS_RESOLVED:
+        return _SPECIAL_KEYS_RESOLVED[key_name]
 
     # Single character keys
     if len(key_name) == 1:
@@ -52,36 +104,146 @@ def _gdk_name_to_pynput(key_name):
     return None
 
 
+class _EvdevBackend:
+    """Reads key presses from /dev/input keyboards in an epoll loop.
+
+    Events are matched on the key code in the listener thread, with no
+    round trip through the X server.
+    """
+
+    def __init__(self, keycode, on_press):
+        self._keycode = keycode
+        self._on_press = on_press
+        self._devices = {}
+        self._wake_r = self._wake_w = None
+        self._thread = None
+
+    def start(self):
+        """Open every readable keyboard with the hotkey; False if none."""
+        for path in evdev.list_devices():
+            try:
+                device = evdev.InputDevice(path)
+            except OSError:
+                continue
+            if self._keycode in device.capabilities().get(ecodes.EV_KEY, ()):
+                self._devices[device.fd] = device
+            else:
+                device.close()
+        if not self._devices:
+            return False
+
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(
+            target=self._run, name="evdev-hotkey", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self):
+        if self._thread is not None:
+            os.write(self._wake_w, b"\0")
+            self._thread.join(timeout=1)
+            self._thread = None
+        for device in self._devices.values():
+            device.close()
+        self._devices.clear()
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r = self._wake_w = None
+
+    def _run(self):
+        keycode = self._keycode
+        with select.epoll() as poller:
+            poller.register(self._wake_r, select.EPOLLIN)
+            for fd in self._devices:
+                poller.register(fd, select.EPOLLIN)
+            while True:
+                for fd, _mask in poller.poll():
+                    if fd == self._wake_r:
+                        return
+                    try:
+                        events = self._devices[fd].read()
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        # Keyboard unplugged
+                        poller.unregister(fd)
+                        continue
+                    for event in events:
+                        # value 1 is key down; 2 (autorepeat) is ignored
+                        if (
+                            event.type == ecodes.EV_KEY
+                            and event.code == keycode
+                            and event.value == 1
+                        ):
+                            self._on_press()
+
+
 class GlobalHotkey:
     """Manages a system-wide hotkey listener."""
 
     def __init__(self):
         self._listener = None
+        self._evdev = None
+        self._evdev_code = None
         self._target_key = None
+        self._key_name = None
         self._callback = None
-        self._lock = threading.Lock()
+        # Replaced wholesale by set_hotkey; a single attribute read in the
+        # listener thread is atomic, so the hot path needs no lock.
+        self._target_set = frozenset()
 
     @property
     def available(self):
-        return PYNPUT_AVAILABLE
+        return PYNPUT_AVAILABLE or EVDEV_AVAILABLE
 
     def set_hotkey(self, gdk_key_name, callback):
         """Configure the hotkey. Restarts the listener if already running."""
-        with self._lock:
-            self._target_key = _gdk_name_to_pynput(gdk_key_name)
-            self._callback = callback
-            if self._target_key is None:
-                log.warning("Could not map key %r to pynput", gdk_key_name)
-
+        target = _gdk_name_to_pynput(gdk_key_name)
+        evdev_code = _gdk_name_to_evdev(gdk_key_name)
+        if target is None and evdev_code is None and self.available:
+            log.warning("Could not map key %r to a global hotkey", gdk_key_name)
+        if target is None:
+            target_set = frozenset()
+        elif isinstance(target, keyboard.Key):
+            target_set = frozenset({target})
+        else:
+            target_set = frozenset({target.char})
+        self._target_key = target
+        self._key_name = gdk_key_name
+        self._evdev_code = evdev_code
+        self._callback = callback
+        self._target_set = target_set
         # Restart listener with new key
         self.stop()
         self.start()
 
     def start(self):
         """Start the global listener in a daemon thread."""
-        if not PYNPUT_AVAILABLE:
+        if self._listener is not None or self._evdev is not None:
             return
-        if self._listener is not None:
+
+        if self._evdev_code is not None:
+            backend = _EvdevBackend(self._evdev_code, self._fire)
+            try:
+                started = backend.start()
+            except OSError as exc:
+                log.debug("evdev hotkey unavailable: %s", exc)
+                backend.stop()
+                started = False
+            if started:
+                self._evdev = backend
+                log.info("Global hotkey listener started (evdev)")
+                return
+
+        if not PYNPUT_AVAILABLE or self._target_key is None:
+            # A key neither backend maps was reported by set_hotkey
+            if self._evdev_code is not None:
+                log.warning(
+                    "Could not open a keyboard for global hotkey %r",
+                    self._key_name,
+                )
             return
 
         self._listener = keyboard.Listener(on_press=self._on_press)
@@ -91,29 +253,26 @@ class GlobalHotkey:
 
     def stop(self):
         """Stop the global listener."""
+        if self._evdev is not None:
+            self._evdev.stop()
+            self._evdev = None
+            log.info("Global hotkey listener stopped")
         if self._listener is not None:
             self._listener.stop()
             self._listener = None
             log.info("Global hotkey listener stopped")
 
     def _on_press(self, key):
-        with self._lock:
-            target = self._target_key
-            callback = self._callback
+        # Special keys compare as themselves, character keys by their char
+        probe = key if isinstance(key, keyboard.Key) else getattr(key, "char", None)
+        if probe in self._target_set:
+            self._fire()
 
-        if target is None or callback is None:
+    def _fire(self):
+        callback = self._callback
+        if callback is None:
             return
-
-        # Compare the pressed key against the target
-        match = False
-        if isinstance(target, keyboard.Key):
-            match = key == target
-        elif isinstance(target, keyboard.KeyCode):
-            if isinstance(key, keyboard.KeyCode):
-                match = key.char == target.char if key.char else False
-
-        if match:
-            try:
-                callback()
-            except Exception:
-                log.exception("Global hotkey callback error")
+        try:
+            callback()
+        except Exception:
+            log.exception("Global hotkey callback error")
@@ -1,5 +1,7 @@
 """Recording view — main transcription surface"""
 
+import os
+
 import gi
 
 gi.require_version("Gtk", "4.0")
@@ -7,6 +9,12 @@ gi.require_version("Adw", "1")
 
 from gi.repository import Gtk, Adw, Pango, GLib  # noqa: E402
 
+# Oldest transcript lines are dropped beyond this to bound layout cost
+MAX_LINES = 500
+
+# Status updates arriving closer together than this show only the last one
+STATUS_THROTTLE_MS = 100
+
 
 class RecordingView(Gtk.Box):
     """Recording surface with transcript display and record button"""
@@ -19,7 +27,17 @@ class RecordingView(Gtk.Box):
         )
         self.engine = engine
         self._is_recording = False
-        self._partial_mark = None
+        self._button_recording = False
+        self._status_class = "status-idle"
+        self._pending_status = None
+        self._status_source = 0
+        self._partial_start_mark = None
+        self._partial_end_mark = None
+        self._partial_text = ""
+        # The last transcript line is still being committed to
+        self._line_open = False
+        self._scroll_source = 0
+
         self._build_ui()
 
     def _build_ui(self):
@@ -99,19 +117,23 @@ class RecordingView(Gtk.Box):
             weight=Pango.Weight.NORMAL,
         )
 
-        # Placeholder
-        self.text_buffer.set_text(
-            "Press the record button or your hotkey to begin transcription..."
-        )
-        start = self.text_buffer.get_start_iter()
-        end = self.text_buffer.get_end_iter()
-        self.text_buffer.apply_tag(self.tag_partial, start, end)
-        self._has_placeholder = True
-
         scroll.set_child(self.text_view)
-        transcript_frame.set_child(scroll)
         self._scroll = scroll
 
+        # Placeholder floats above the empty view instead of living in
+        # the buffer, so showing/hiding it never edits the text
+        self._placeholder_label = Gtk.Label(
+            label="Press the record button or your hotkey to begin transcription...",
+            css_classes=["dim-label"],
+            halign=Gtk.Align.CENTER,
+            valign=Gtk.Align.CENTER,
+            wrap=True,
+            can_target=False,
+        )
+        overlay = Gtk.Overlay(child=scroll)
+        overlay.add_overlay(self._placeholder_label)
+        transcript_frame.set_child(overlay)
+
         # ── Bottom controls ────────────────────────────────────
         controls_box = Gtk.Box(
             orientation=Gtk.Orientation.HORIZONTAL,
@@ -162,9 +184,7 @@ class RecordingView(Gtk.Box):
             self._start_recording()
 
     def _start_recording(self):
-        if self._has_placeholder:
-            self.text_buffer.set_text("")
-            self._has_placeholder = False
+        self._placeholder_label.set_visible(False)
         self._is_recording = True
         self._update_record_button()
         self.engine.start_recording()
@@ -177,6 +197,9 @@ class RecordingView(Gtk.Box):
         self.target_label.set_visible(False)
 
     def _update_record_button(self):
+        if self._is_recording == self._button_recording:
+            return
+        self._button_recording = self._is_recording
         icon = self.record_button.get_child()
         if self._is_recording:
             icon.set_from_icon_name("media-playback-stop-symbolic")
@@ -192,68 +215,164 @@ class RecordingView(Gtk.Box):
     def _update_target_label(self):
         """Show which window text will be typed into (if auto-type is on)."""
         origin = self.engine._origin_window
+        if origin is not None and not origin.ready:
+            # The snapshot is still being taken off-thread; try again then
+            origin.add_done_callback(
+                lambda _snapshot: GLib.idle_add(self._update_target_label)
+            )
+            return False
+        if not self._is_recording:
+            self.target_label.set_visible(False)
+            return False
         if self.engine._auto_type and origin and origin.valid and origin.window_name:
             self.target_label.set_label(f"Typing into: {origin.window_name}")
             self.target_label.set_visible(True)
         else:
             self.target_label.set_visible(False)
+        return False
 
     def set_status(self, status):
-        self.status_label.set_label(status)
-        self.status_icon.remove_css_class("status-idle")
-        self.status_icon.remove_css_class("status-recording")
-        self.status_icon.remove_css_class("status-processing")
-        if "recording" in status.lower():
-            self.status_icon.add_css_class("status-recording")
-        elif "processing" in status.lower() or "transcribing" in status.lower():
-            self.status_icon.add_css_class("status-processing")
-        else:
-            self.status_icon.add_css_class("status-idle")
-
-    def append_transcript(self, result):
-        if self._has_placeholder:
-            self.text_buffer.set_text("")
-            self._has_placeholder = False
+        """Show a status message; changes within STATUS_THROTTLE_MS collapse."""
+        self._pending_status = status
+        if self._status_source == 0:
+            self._status_source = GLib.timeout_add(
+                STATUS_THROTTLE_MS, self._flush_status
+            )
 
-        is_partial = result.get("is_partial", False)
-        text = result.get("data", {}).get("text", "").strip()
+    def _flush_status(self):
+        self._status_source = 0
+        self._apply_status(self._pending_status)
+        return False
 
-        if not text:
+    def _apply_status(self, status):
+        self.status_label.set_label(status)
+        lowered = status.lower()
+        if "recording" in lowered:
+            status_class = "status-recording"
+        elif "processing" in lowered or "transcribing" in lowered:
+            status_class = "status-processing"
+        else:
+            status_class = "status-idle"
+        if status_class == self._status_class:
             return
+        self.status_icon.remove_css_class(self._status_class)
+        self.status_icon.add_css_class(status_class)
+        self._status_class = status_class
 
-        # Remove previous partial line if present
-        if self._partial_mark is not None:
-            partial_iter = self.text_buffer.get_iter_at_mark(self._partial_mark)
-            end_iter = self.text_buffer.get_end_iter()
-            self.text_buffer.delete(partial_iter, end_iter)
-
-        end_iter = self.text_buffer.get_end_iter()
-
+    def append_transcript(self, is_partial, text):
+        """Display a single transcript segment (GTK thread only)."""
         if is_partial:
-            self._partial_mark = self.text_buffer.create_mark(
-                "partial_start", end_iter, True
-            )
-            self.text_buffer.insert(end_iter, text)
-            mark_iter = self.text_buffer.get_iter_at_mark(self._partial_mark)
-            end_iter = self.text_buffer.get_end_iter()
-            self.text_buffer.apply_tag(self.tag_partial, mark_iter, end_iter)
+            self.show_transcripts((), text)
         else:
-            if self._partial_mark is not None:
-                self.text_buffer.delete_mark(self._partial_mark)
-                self._partial_mark = None
-            self.text_buffer.insert(end_iter, text + "\n")
-            line_start = self.text_buffer.get_end_iter()
-            line_start.backward_chars(len(text) + 1)
-            end_iter = self.text_buffer.get_end_iter()
-            self.text_buffer.apply_tag(self.tag_final, line_start, end_iter)
-
-        # Auto-scroll to bottom
+            self.show_transcripts((text,), None)
+
+    def show_transcripts(self, finals, partial):
+        """Append *finals* in order, then show *partial* (if any) after them.
+
+        Finals continue the current line; a final of None ends the line
+        (the engine's segment boundary).  The window batches everything
+        the engine emitted during one main-loop iteration into a single
+        call.  Texts are expected to be already stripped by the engine.
+        """
+        self._placeholder_label.set_visible(False)
+
+        # Group the whole batch into one user action so the view
+        # invalidates its layout once rather than per edit
+        self.text_buffer.begin_user_action()
+        try:
+            for text in finals:
+                if text is None:
+                    self._end_line()
+                elif text:
+                    self._append_final(text)
+            if partial:
+                self._update_partial(" " + partial if self._line_open else partial)
+        finally:
+            self.text_buffer.end_user_action()
+
+        if self._scroll_source == 0:
+            self._scroll_source = GLib.idle_add(self._scroll_to_end)
+
+    def _scroll_to_end(self):
+        """Auto-scroll to bottom once Pango has relaid out the new text."""
+        self._scroll_source = 0
         end_iter = self.text_buffer.get_end_iter()
         self.text_view.scroll_to_iter(end_iter, 0.0, False, 0.0, 1.0)
+        return False
+
+    def _append_final(self, text):
+        self._clear_partial()
+        if self._line_open:
+            text = " " + text
+        buf = self.text_buffer
+        get_end_iter = buf.get_end_iter
+        buf.insert(get_end_iter(), text)
+        start = get_end_iter()
+        start.backward_chars(len(text))
+        buf.apply_tag(self.tag_final, start, get_end_iter())
+        self._line_open = True
+
+    def _end_line(self):
+        self._clear_partial()
+        if not self._line_open:
+            return
+        self.text_buffer.insert(self.text_buffer.get_end_iter(), "\n")
+        self._line_open = False
+        self._trim_lines()
+
+    def _trim_lines(self):
+        """Drop the oldest lines once the transcript exceeds MAX_LINES."""
+        line_count = self.text_buffer.get_line_count()
+        if line_count <= MAX_LINES:
+            return
+        start = self.text_buffer.get_start_iter()
+        _found, cut = self.text_buffer.get_iter_at_line(line_count - MAX_LINES)
+        self.text_buffer.delete(start, cut)
+
+    def _update_partial(self, text):
+        """Rewrite the partial span in place, touching only the changed suffix."""
+        if text == self._partial_text:
+            return
+        buf = self.text_buffer
+        if self._partial_start_mark is None:
+            end_iter = buf.get_end_iter()
+            self._partial_start_mark = buf.create_mark("partial_start", end_iter, True)
+            self._partial_end_mark = buf.create_mark("partial_end", end_iter, False)
+            self._partial_text = ""
+
+        prefix_len = len(os.path.commonprefix([self._partial_text, text]))
+        start = buf.get_iter_at_mark(self._partial_start_mark)
+        start.forward_chars(prefix_len)
+        offset = start.get_offset()
+        buf.delete(start, buf.get_iter_at_mark(self._partial_end_mark))
+
+        suffix = text[prefix_len:]
+        if suffix:
+            buf.insert(buf.get_iter_at_offset(offset), suffix)
+            buf.apply_tag(
+                self.tag_partial,
+                buf.get_iter_at_offset(offset),
+                buf.get_iter_at_offset(offset + len(suffix)),
+            )
+        self._partial_text = text
+
+    def _clear_partial(self):
+        """Remove the partial span (if any) and its marks."""
+        if self._partial_start_mark is None:
+            return
+        buf = self.text_buffer
+        buf.delete(
+            buf.get_iter_at_mark(self._partial_start_mark),
+            buf.get_iter_at_mark(self._partial_end_mark),
+        )
+        buf.delete_mark(self._partial_start_mark)
+        buf.delete_mark(self._partial_end_mark)
+        self._partial_start_mark = None
+        self._partial_end_mark = None
+        self._partial_text = ""
 
     def _on_clear_clicked(self, _button):
+        self._clear_partial()
         self.text_buffer.set_text("")
-        self._has_placeholder = False
-        if self._partial_mark is not None:
-            self.text_buffer.delete_mark(self._partial_mark)
-            self._partial_mark = None
+        self._line_open = False
+        self._placeholder_label.set_visible(True)
@@ -1,7 +1,14 @@
 """Settings view — theme, hotkey, model selection, clipboard, offline mode"""
 
 import json
+import logging
 import os
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import gi
 
@@ -11,9 +18,24 @@ gi.require_version("Adw", "1")
 from gi.repository import Gtk, Adw, Gdk, GLib  # noqa: E402
 
 
+log = logging.getLogger(__name__)
+
 CONFIG_DIR = os.path.join(GLib.get_user_config_dir(), "whisperflow")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "settings.json")
 
+# Create the config directory once, so saving is just a file write
+try:
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+except OSError as exc:
+    log.warning("Could not create config directory %s: %s", CONFIG_DIR, exc)
+
+# Parsed settings.json keyed by its mtime, so rebuilding the settings
+# view doesn't re-read an unchanged file
+_SETTINGS_CACHE = {"mtime": None, "data": None}
+
+# Settings changes within this window are written to disk together
+SAVE_DEBOUNCE_MS = 500
+
 AVAILABLE_MODELS = [
     ("tiny.en", "Tiny (English)", "Fastest, least accurate (~72 MB)"),
     ("base.en", "Base (English)", "Good balance of speed and accuracy (~142 MB)"),
@@ -28,6 +50,8 @@ THEME_OPTIONS = [
     ("dark", "Dark"),
 ]
 
+_THEME_ID_TO_INDEX = {tid: idx for idx, (tid, _) in enumerate(THEME_OPTIONS)}
+
 DEFAULT_SETTINGS = {
     "hotkey": "F9",
     "model": "tiny.en",
@@ -35,22 +59,29 @@ DEFAULT_SETTINGS = {
     "theme": "system",
     "auto_clipboard": False,
     "auto_type": False,
+    "use_paste": False,
 }
 
 
 class SettingsView(Gtk.Box):
     """Settings panel with all user-facing preferences"""
 
-    def __init__(self, engine, **kwargs):
+    def __init__(self, engine, settings, on_hotkey_changed=None, **kwargs):
+        """*settings* is the dict already loaded and applied to *engine*
+        (see load_settings / apply_settings); it is edited in place."""
         super().__init__(
             orientation=Gtk.Orientation.VERTICAL,
             spacing=0,
             **kwargs,
         )
         self.engine = engine
-        self.settings = self._load_settings()
+        self.settings = settings
+        self._on_hotkey_changed = on_hotkey_changed
+        self._save_source_id = 0
+        # Most recent background writer; each one waits for the one
+        # before it, so snapshots reach the disk in order
+        self._writer = None
         self._build_ui()
-        self._apply_settings()
 
     def _build_ui(self):
         clamp = Adw.Clamp(
@@ -83,10 +114,7 @@ class SettingsView(Gtk.Box):
 
         # Set current selection
         current_theme = self.settings.get("theme", "system")
-        for idx, (tid, _) in enumerate(THEME_OPTIONS):
-            if tid == current_theme:
-                self.theme_combo.set_selected(idx)
-                break
+        self.theme_combo.set_selected(_THEME_ID_TO_INDEX.get(current_theme, 0))
         self.theme_combo.connect("notify::selected", self._on_theme_changed)
         appearance_group.add(self.theme_combo)
 
@@ -140,6 +168,18 @@ class SettingsView(Gtk.Box):
         self.auto_type_row.connect("notify::active", self._on_auto_type_toggled)
         output_group.add(self.auto_type_row)
 
+        self.paste_row = Adw.SwitchRow(
+            title="Paste Instead of Typing",
+            subtitle=(
+                "Insert text with a single Ctrl+Shift+V paste rather than "
+                "one keystroke per character; apps that bind that chord "
+                "to something else receive nothing"
+            ),
+        )
+        self.paste_row.set_active(self.settings.get("use_paste", False))
+        self.paste_row.connect("notify::active", self._on_paste_toggled)
+        output_group.add(self.paste_row)
+
         # ── Model ──────────────────────────────────────────────
         model_group = Adw.PreferencesGroup(
             title="Model",
@@ -147,6 +187,7 @@ class SettingsView(Gtk.Box):
         )
 
         self.model_rows = {}
+        first_check = None
         for model_id, model_name, model_desc in AVAILABLE_MODELS:
             row = Adw.ActionRow(
                 title=model_name,
@@ -158,8 +199,9 @@ class SettingsView(Gtk.Box):
             )
             if model_id == self.settings["model"]:
                 check.set_active(True)
-            if self.model_rows:
-                first_check = list(self.model_rows.values())[0]
+            if first_check is None:
+                first_check = check
+            else:
                 check.set_group(first_check)
             check.connect("toggled", self._on_model_toggled, model_id)
             row.add_prefix(check)
@@ -219,6 +261,8 @@ class SettingsView(Gtk.Box):
         self.hotkey_label.set_label(key_name)
         self._save_settings()
         self.engine.set_hotkey(key_name)
+        if self._on_hotkey_changed:
+            self._on_hotkey_changed(key_name)
 
     # ── Output toggles ─────────────────────────────────────────
 
@@ -232,6 +276,11 @@ class SettingsView(Gtk.Box):
         self._save_settings()
         self.engine.set_auto_type(row.get_active())
 
+    def _on_paste_toggled(self, row, _pspec):
+        self.settings["use_paste"] = row.get_active()
+        self._save_settings()
+        self.engine.set_use_paste(row.get_active())
+
     # ── Model / Offline ────────────────────────────────────────
 
     def _on_model_toggled(self, check, model_id):
@@ -245,41 +294,98 @@ class SettingsView(Gtk.Box):
         self._save_settings()
         self.engine.set_offline(row.get_active())
 
-    # ── Accessors ──────────────────────────────────────────────
+    # ── Save ───────────────────────────────────────────────────
+
+    def _save_settings(self):
+        """Schedule a debounced write of the current settings."""
+        if self._save_source_id:
+            GLib.source_remove(self._save_source_id)
+        self._save_source_id = GLib.timeout_add(SAVE_DEBOUNCE_MS, self._do_save)
+
+    def flush_settings(self):
+        """Finish writes already under way, then write any pending
+        settings change now, on the calling thread."""
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        if not self._save_source_id:
+            return
+        GLib.source_remove(self._save_source_id)
+        self._save_source_id = 0
+        self._write_settings(dict(self.settings))
+
+    def _do_save(self):
+        self._save_source_id = 0
+        snapshot = dict(self.settings)
+        self._writer = threading.Thread(
+            target=self._write_after,
+            args=(self._writer, snapshot),
+            daemon=True,
+        )
+        self._writer.start()
+        return False
+
+    def _write_after(self, previous, settings):
+        """Write *settings* once the *previous* writer has finished."""
+        if previous is not None:
+            previous.join()
+        self._write_settings(settings)
+
+    def _write_settings(self, settings):
+        """Write settings atomically (tmp file + rename).  Runs off the GTK thread."""
+        if orjson is not None:
+            data = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(settings, separators=(",", ":")).encode("utf-8")
+        tmp_path = CONFIG_FILE + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, CONFIG_FILE)
+        except OSError as exc:
+            log.warning("Could not save settings to %s: %s", CONFIG_FILE, exc)
 
-    def get_hotkey_keyval(self):
-        key_name = self.settings.get("hotkey", "F9")
-        keyval = Gdk.keyval_from_name(key_name)
-        if keyval == Gdk.KEY_VoidSymbol:
-            return None
-        return keyval
 
-    def get_hotkey_name(self):
-        return self.settings.get("hotkey", "F9")
+# ── Load / Apply ───────────────────────────────────────────────
 
-    # ── Apply / Load / Save ────────────────────────────────────
 
-    def _apply_settings(self):
-        self.engine.set_model(self.settings["model"])
-        self.engine.set_offline(self.settings["offline_mode"])
-        self.engine.set_auto_clipboard(self.settings.get("auto_clipboard", False))
-        self.engine.set_auto_type(self.settings.get("auto_type", False))
-        apply_theme(self.settings.get("theme", "system"))
+def load_settings():
+    """Return the saved settings merged over DEFAULT_SETTINGS."""
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return dict(DEFAULT_SETTINGS)
 
-    def _load_settings(self):
+    if _SETTINGS_CACHE["mtime"] != mtime:
         try:
             with open(CONFIG_FILE, "r") as f:
                 saved = json.load(f)
-                merged = dict(DEFAULT_SETTINGS)
-                merged.update(saved)
-                return merged
-        except (FileNotFoundError, json.JSONDecodeError):
+        except (OSError, json.JSONDecodeError):
             return dict(DEFAULT_SETTINGS)
-
-    def _save_settings(self):
-        os.makedirs(CONFIG_DIR, exist_ok=True)
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(self.settings, f, indent=2)
+        merged = dict(DEFAULT_SETTINGS)
+        merged.update(saved)
+        _SETTINGS_CACHE["mtime"] = mtime
+        _SETTINGS_CACHE["data"] = merged
+    return dict(_SETTINGS_CACHE["data"])
+
+
+def apply_settings(engine, settings):
+    """Push loaded settings into the engine and the style manager."""
+    # Offline mode first, so a model preload never downloads by mistake
+    engine.set_offline(settings["offline_mode"])
+    engine.set_model(settings["model"])
+    engine.set_auto_clipboard(settings.get("auto_clipboard", False))
+    engine.set_auto_type(settings.get("auto_type", False))
+    engine.set_use_paste(settings.get("use_paste", False))
+    apply_theme(settings.get("theme", "system"))
+
+
+def hotkey_keyval(key_name):
+    """Resolve a GDK key name to a keyval, or None if it isn't a key."""
+    keyval = Gdk.keyval_from_name(key_name)
+    if keyval == Gdk.KEY_VoidSymbol:
+        return None
+    return keyval
 
 
 # ── Theme helper ───────────────────────────────────────────────
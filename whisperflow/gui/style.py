@@ -8,7 +8,7 @@ import gi
 
 gi.require_version("Gtk", "4.0")
 
-from gi.repository import Gtk, Gdk  # noqa: E402
+from gi.repository import Gtk, Gdk, GLib  # noqa: E402
 
 CSS = """
 /* ── Transcript area ────────────────────────────────────── */
@@ -107,11 +107,19 @@ CSS = """
 """
 
 
+_CSS_BYTES = GLib.Bytes.new(CSS.encode("utf-8"))
+_PROVIDER = None
+
+
 def load_css():
-    provider = Gtk.CssProvider()
-    provider.load_from_string(CSS)
+    """Register the application stylesheet once per process."""
+    global _PROVIDER
+    if _PROVIDER is not None:
+        return
+    _PROVIDER = Gtk.CssProvider()
+    _PROVIDER.load_from_bytes(_CSS_BYTES)
     Gtk.StyleContext.add_provider_for_display(
         Gdk.Display.get_default(),
-        provider,
+        _PROVIDER,
         Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
     )
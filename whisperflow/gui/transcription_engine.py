@@ -1,26 +1,39 @@
 """Transcription engine — bridges the GUI to WhisperFlow's backend.
 
 Handles audio capture, model inference, and output routing (clipboard,
-active-window typing).  Runs the heavy work in a background thread so
+active-window typing).  PortAudio delivers microphone blocks through a
+stream callback into a bounded queue, and a background thread runs
+Whisper over them, so audio keeps flowing while the model is busy and
 the GTK main loop stays responsive.
 """
 
 import logging
 import os
 import threading
+import time
 import queue
 
 import numpy as np
 
+import torch
 import whisper
 from whisper import Whisper
 
-from whisperflow.gui.window_tracker import (
-    WindowSnapshot,
-    set_clipboard,
-    type_text,
-    focus_window,
-)
+try:
+    import pyaudio
+
+    PYAUDIO_AVAILABLE = True
+except ImportError:
+    PYAUDIO_AVAILABLE = False
+
+try:
+    import faster_whisper
+
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+from whisperflow.gui.window_tracker import WindowSnapshot, set_clipboard
 
 log = logging.getLogger(__name__)
 
@@ -34,27 +47,135 @@ MODEL_FILES = {
 
 MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
 
+# "faster" runs CTranslate2 INT8 models through faster-whisper when it is
+# installed; "whisper" forces the reference PyTorch implementation.
+BACKEND = os.getenv("WHISPERFLOW_BACKEND", "faster")
+
+SAMPLE_RATE = 16000
+CHUNK_FRAMES = 1024
+TRANSCRIBE_INTERVAL = 0.5
+MAX_WINDOW_SECONDS = 30
+
+# int16 PCM -> [-1.0, 1.0) float32, applied as a multiply
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Once a segment holds this much audio, all but its last word is committed
+# even if the text has not settled yet, so each pass decodes a bounded
+# slice.  Continuity across the cut comes from prompting with the tail of
+# the finalized text.
+SEGMENT_MAX_SECONDS = 8
+PROMPT_TAIL_CHARS = 200
+
+# Words ending at least this far before the end of the audio are final:
+# later audio won't change them, so they are committed and their samples
+# sliced off the front of the segment.
+COMMIT_LAG_SECONDS = 0.4
+
+# After a commit, wait for one interval's worth of whole capture blocks
+# before decoding again, and only decode it if it is voiced; otherwise the
+# next pass re-decodes the undecided tail plus silence, which Whisper tends
+# to hallucinate over.  Audio arrives CHUNK_FRAMES at a time while ticks
+# follow the clock, so a full TRANSCRIBE_INTERVAL of samples would often
+# be one block short at the tick and skip a pass.
+MIN_DECODE_SAMPLES = (
+    int(SAMPLE_RATE * TRANSCRIBE_INTERVAL) // CHUNK_FRAMES * CHUNK_FRAMES
+)
+
+# Silence that is skipped is dropped from the segment except for this
+# much, so a word starting right after it keeps its onset
+PRE_ROLL_SECONDS = 0.3
+
+# RMS (as a fraction of full scale) below which new audio is treated as
+# silence and not decoded
+SILENCE_RMS = 0.005
+_SILENCE_RMS_INT16 = SILENCE_RMS * 32768.0
+
+# Loaded models kept around so switching back to one is instant
+MODEL_CACHE_SIZE = 2
+
+# Enough room for ~30 s of audio while the model is still loading
+AUDIO_QUEUE_CHUNKS = int(SAMPLE_RATE * 30 / CHUNK_FRAMES)
+
+
+def _put_dropping_oldest(audio_queue, item):
+    """Enqueue without blocking; if inference fell behind (e.g. still
+    loading the model), drop the oldest chunk rather than stall PortAudio."""
+    try:
+        audio_queue.put_nowait(item)
+    except queue.Full:
+        try:
+            audio_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            audio_queue.put_nowait(item)
+        except queue.Full:
+            # Another producer refilled the freed slot; drop this chunk
+            pass
+
+
+def _count_final_words(words, buffer_seconds):
+    """Return how many leading *words* ended at least COMMIT_LAG_SECONDS
+    before the end of a *buffer_seconds* long buffer."""
+    cutoff = buffer_seconds - COMMIT_LAG_SECONDS
+    count = 0
+    while count < len(words) and words[count][1] <= cutoff:
+        count += 1
+    return count
+
+
+def _is_silent(samples):
+    """True if the RMS of int16 *samples* is below SILENCE_RMS."""
+    rms = np.sqrt(np.mean(np.square(samples, dtype=np.float32)))
+    return rms < _SILENCE_RMS_INT16
+
 
 class TranscriptionEngine:
     """Manages audio capture, Whisper model, and streaming transcription."""
 
+    # (model_name, device, BACKEND) -> (model, backend), least recent first
+    _MODEL_CACHE = {}
+
     def __init__(self):
         self._model = None
         self._model_name = "tiny.en"
+        self._backend = "whisper"
+        self._fp16 = False
         self._offline = False
         self._recording = False
         self._auto_clipboard = False
         self._auto_type = False
+        self._use_paste = False
+        # Text committed so far in the current segment, for the clipboard
+        self._utterance = ""
 
         self._status_cb = None
         self._transcript_cb = None
-        self._audio_queue = queue.Queue()
+        self._audio_queue = queue.Queue(maxsize=AUDIO_QUEUE_CHUNKS)
         self._stop_event = threading.Event()
         self._worker_thread = None
 
+        # Kept open across recordings; see _start_stream()
+        self._pa = None
+        self._stream = None
+        self._capture_queue = None
+
+        # Fixed-size int16 window of the current segment, plus a reused
+        # float32 buffer for the int16 -> float conversion
+        self._ring = np.empty(SAMPLE_RATE * MAX_WINDOW_SECONDS, dtype=np.int16)
+        self._ring_len = 0
+        self._audio_scratch = np.empty(
+            SAMPLE_RATE * MAX_WINDOW_SECONDS, dtype=np.float32
+        )
+        self._pinned_audio = None
+
         # Snapshot of the window that was active when recording started
         self._origin_window = None
 
+        # Background model load; started by preload() once the settings
+        # (model name, offline mode) have been applied
+        self._load_thread = None
+
     # ── Callback wiring (called from GUI) ──────────────────────
 
     def connect_status(self, callback):
@@ -67,15 +188,26 @@ class TranscriptionEngine:
         if self._status_cb:
             self._status_cb(text)
 
-    def _emit_transcript(self, result):
+    def _emit_transcript(self, is_partial, text):
         if self._transcript_cb:
-            self._transcript_cb(result)
+            self._transcript_cb(is_partial, text)
+
+    def _end_segment(self):
+        """Close the current segment: a final of None tells the view to end
+        the transcript line, and the next commit starts a new utterance."""
+        self._utterance = ""
+        self._emit_transcript(False, None)
 
     # ── Settings ───────────────────────────────────────────────
 
     def set_model(self, model_name):
+        if model_name == self._model_name:
+            return
         self._model_name = model_name
         self._model = None
+        # Only reload eagerly once preload() has been asked for
+        if self._load_thread is not None:
+            self._start_preload()
 
     def set_offline(self, offline):
         self._offline = offline
@@ -86,38 +218,195 @@ class TranscriptionEngine:
     def set_auto_type(self, enabled):
         self._auto_type = enabled
 
+    def set_use_paste(self, enabled):
+        self._use_paste = enabled
+
     def set_hotkey(self, _key_name):
         """Placeholder — the global hotkey is managed by the window."""
         pass
 
     # ── Model loading ──────────────────────────────────────────
 
+    def preload(self):
+        """Start loading the configured model in the background, so the
+        first recording doesn't wait for it."""
+        if self._model is None and self._load_thread is None:
+            self._start_preload()
+
+    def _start_preload(self):
+        """Load the current model in the background so recording starts warm."""
+        self._load_thread = threading.Thread(target=self._load_model, daemon=True)
+        self._load_thread.start()
+
+    def _wait_for_model(self, stop_event=None):
+        """Block until the newest preload finishes; load inline if it failed.
+
+        If *stop_event* is set meanwhile, the microphone is paused at once
+        rather than when the load completes; what it captured until then is
+        still transcribed.
+        """
+        while True:
+            thread = self._load_thread
+            if thread is not None:
+                thread.join(timeout=0.1)
+                if stop_event is not None and stop_event.is_set():
+                    self._pause_stream()
+                if thread.is_alive():
+                    continue
+            if thread is self._load_thread:
+                break
+        if stop_event is not None and stop_event.is_set():
+            self._pause_stream()
+        if self._model is None:
+            return self._load_model()
+        return True
+
     def _load_model(self):
-        self._emit_status("Loading model...")
-        file_name = MODEL_FILES.get(self._model_name, "tiny.en.pt")
+        model_name = self._model_name
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        key = (model_name, device, BACKEND)
+
+        cache = TranscriptionEngine._MODEL_CACHE
+        cached = cache.pop(key, None)
+        if cached is None:
+            self._emit_status("Loading model...")
+            cached = self._load_model_from_disk(model_name, device)
+            if cached is None:
+                return False
+        # Re-insert so the least recently used model is evicted first
+        cache[key] = cached
+        while len(cache) > MODEL_CACHE_SIZE:
+            del cache[next(iter(cache))]
+            if device == "cuda":
+                # Hand the evicted model's blocks back to the driver
+                torch.cuda.empty_cache()
+
+        # The model may have been switched while this one was loading
+        if model_name != self._model_name:
+            return False
+        self._model, self._backend = cached
+        self._fp16 = device == "cuda"
+        if self._fp16 and self._pinned_audio is None:
+            self._pin_audio_scratch()
+        self._emit_status("Model loaded")
+        return True
+
+    def _pin_audio_scratch(self):
+        """Back the float32 scratch buffer with page-locked memory.
+
+        The int16 -> float conversion then writes straight into a buffer
+        the GPU can DMA from, so the host-to-device copy skips the
+        driver's pageable staging copy and can run asynchronously.
+        """
+        try:
+            pinned = torch.empty(
+                SAMPLE_RATE * MAX_WINDOW_SECONDS,
+                dtype=torch.float32,
+                pin_memory=True,
+            )
+        except RuntimeError as exc:
+            log.warning("Could not pin audio buffer: %s", exc)
+            return
+        self._pinned_audio = pinned
+        self._audio_scratch = pinned.numpy()
+
+    def _load_model_from_disk(self, model_name, device):
+        """Return ``(model, backend)``, or None after reporting the failure."""
+        file_name = MODEL_FILES.get(model_name, "tiny.en.pt")
         local_path = os.path.join(MODELS_DIR, file_name)
 
         try:
-            import torch
-
-            device = "cuda" if torch.cuda.is_available() else "cpu"
-
-            if os.path.exists(local_path):
-                self._model = whisper.load_model(local_path).to(device)
-            elif not self._offline:
-                model_size = self._model_name.replace(".en", "")
-                self._model = whisper.load_model(
-                    model_size, download_root=MODELS_DIR
-                ).to(device)
-            else:
-                self._emit_status("Model not available offline")
-                return False
+            # Leave half the cores for audio capture and the GTK loop
+            cpu_threads = max(1, (os.cpu_count() or 2) // 2)
+
+            model = None
+            backend = "whisper"
+            if BACKEND == "faster" and FASTER_WHISPER_AVAILABLE:
+                model = self._load_faster_model(model_name, device, cpu_threads)
+                backend = "faster"
+
+            if model is None:
+                backend = "whisper"
+                if device == "cpu":
+                    torch.set_num_threads(cpu_threads)
+                if os.path.exists(local_path):
+                    model = whisper.load_model(local_path).to(device)
+                elif not self._offline:
+                    model_size = model_name.replace(".en", "")
+                    model = whisper.load_model(
+                        model_size, download_root=MODELS_DIR
+                    ).to(device)
+                else:
+                    self._emit_status("Model not available offline")
+                    return None
         except Exception as exc:
             self._emit_status(f"Model load failed: {exc}")
-            return False
+            return None
+        return model, backend
 
-        self._emit_status("Model loaded")
-        return True
+    def _load_faster_model(self, model_name, device, cpu_threads):
+        """Load a CTranslate2 INT8 model, or None to fall back to whisper.
+
+        The bundled .pt checkpoints are PyTorch-only, so this needs the
+        converted model in MODELS_DIR or, when online, a download.
+        """
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+        try:
+            return faster_whisper.WhisperModel(
+                model_name,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                download_root=MODELS_DIR,
+                local_files_only=self._offline,
+            )
+        except Exception as exc:
+            log.warning("faster-whisper unavailable for %s: %s", model_name, exc)
+            return None
+
+    def _transcribe(self, arr, prompt):
+        """Run the loaded model over *arr*.
+
+        Returns the recognised words as ``(text, end_seconds)`` pairs; each
+        word's text carries its own leading space.
+        """
+        if self._backend == "faster":
+            segments, _info = self._model.transcribe(
+                arr,
+                language="en",
+                beam_size=1,
+                vad_filter=True,
+                temperature=0.1,
+                log_prob_threshold=-0.5,
+                initial_prompt=prompt or None,
+                word_timestamps=True,
+            )
+            # Segments decode lazily as the generator is consumed
+            return [
+                (word.word, word.end)
+                for segment in segments
+                for word in segment.words or ()
+            ]
+
+        audio = torch.from_numpy(arr)
+        if self._fp16:
+            # Also moves the log-mel STFT onto the GPU
+            audio = audio.to(self._model.device, non_blocking=True)
+        with torch.inference_mode():
+            result = self._model.transcribe(
+                audio,
+                fp16=self._fp16,
+                language="en",
+                temperature=0.1,
+                logprob_threshold=-0.5,
+                initial_prompt=prompt or None,
+                word_timestamps=True,
+            )
+        return [
+            (word["word"], word["end"])
+            for segment in result.get("segments", ())
+            for word in segment.get("words", ())
+        ]
 
     # ── Recording control ──────────────────────────────────────
 
@@ -129,13 +418,22 @@ class TranscriptionEngine:
         # steals focus (the user may have clicked our record button,
         # but for global-hotkey use, this captures the right target).
         self._origin_window = WindowSnapshot()
-        log.info("Origin window captured: %s", self._origin_window)
+        self._origin_window.add_done_callback(
+            lambda snapshot: log.info("Origin window captured: %s", snapshot)
+        )
 
         self._recording = True
-        self._stop_event.clear()
-        self._audio_queue = queue.Queue()
+        # Each session gets its own stop event and queue, so threads from a
+        # session that is still winding down are never revived by this one.
+        stop_event = threading.Event()
+        audio_queue = queue.Queue(maxsize=AUDIO_QUEUE_CHUNKS)
+        previous = self._worker_thread
+        self._stop_event = stop_event
+        self._audio_queue = audio_queue
         self._worker_thread = threading.Thread(
-            target=self._worker_loop, daemon=True
+            target=self._worker_loop,
+            args=(stop_event, audio_queue, previous),
+            daemon=True,
         )
         self._worker_thread.start()
 
@@ -144,125 +442,299 @@ class TranscriptionEngine:
             return
         self._recording = False
         self._stop_event.set()
+        # Wake the worker now instead of at its next queue timeout.  A full
+        # queue already wakes it, and it sees the stop event once drained.
+        try:
+            self._audio_queue.put_nowait(None)
+        except queue.Full:
+            pass
         self._emit_status("Ready")
 
     # ── Output routing ─────────────────────────────────────────
 
-    def _route_final_text(self, text):
-        """Send finalized text to clipboard / active window as configured."""
+    def _route_final_text(self, text, continues=False):
+        """Send finalized text to clipboard / active window as configured.
+
+        *continues* marks text that follows an earlier commit in the same
+        recording, so it is typed with a separating space.
+        """
         if not text:
             return
 
+        # Commits arrive a few words at a time; the clipboard holds the
+        # whole utterance rather than just the latest words
+        self._utterance = f"{self._utterance} {text}" if self._utterance else text
         if self._auto_clipboard:
-            set_clipboard(text)
-            log.info("Copied to clipboard: %s", text[:60])
+            set_clipboard(self._utterance)
+            log.info("Copied to clipboard: %s", self._utterance[:60])
 
         if self._auto_type and self._origin_window and self._origin_window.valid:
-            focus_window(self._origin_window.window_id)
-            type_text(text)
+            typed = " " + text if continues else text
+            self._origin_window.restore_and_type(typed, use_paste=self._use_paste)
             log.info(
                 "Typed into window %s: %s",
                 self._origin_window.window_id,
                 text[:60],
             )
 
-    # ── Worker loop ────────────────────────────────────────────
-
-    def _worker_loop(self):
-        """Background worker: loads model, captures audio, transcribes."""
-        if self._model is None:
-            if not self._load_model():
-                self._recording = False
-                return
+    # ── Audio window ───────────────────────────────────────────
 
-        self._emit_status("Recording...")
+    def _ring_append(self, chunk):
+        """Append int16 samples, discarding the oldest ones when full."""
+        assert chunk.ndim == 1
+        n = chunk.shape[0]
+        size = self._ring.shape[0]
+        if n >= size:
+            self._ring[:] = chunk[-size:]
+            self._ring_len = size
+            return
 
+        overflow = self._ring_len + n - size
+        if overflow > 0:
+            keep = self._ring_len - overflow
+            self._ring[:keep] = self._ring[overflow : self._ring_len]
+            self._ring_len = keep
+
+        self._ring[self._ring_len : self._ring_len + n] = chunk
+        self._ring_len += n
+
+    def _ring_consume(self, count):
+        """Drop the oldest *count* samples, keeping the rest in order."""
+        n = self._ring_len
+        count = min(max(count, 0), n)
+        self._ring[: n - count] = self._ring[count:n]
+        self._ring_len = n - count
+
+    def _decode(self, n, prompt):
+        """Transcribe the first *n* ring samples; a failed pass gives no words."""
+        self._emit_status("Transcribing...")
+        arr = self._audio_scratch[:n]
+        np.multiply(self._ring[:n], _INT16_SCALE, out=arr)
         try:
-            import pyaudio
-        except ImportError:
+            return self._transcribe(arr, prompt)
+        except Exception:
+            return []
+
+    def _commit_words(self, words, prompt):
+        """Emit and route the text of *words*; returns the updated prompt."""
+        committed = "".join(word for word, _end in words).strip()
+        if not committed:
+            return prompt
+        self._emit_transcript(False, committed)
+        self._route_final_text(committed, continues=bool(prompt))
+        return (prompt + " " + committed)[-PROMPT_TAIL_CHARS:]
+
+    # ── Worker threads ─────────────────────────────────────────
+
+    def _start_stream(self, audio_queue):
+        """Start the callback-driven input stream feeding *audio_queue*.
+
+        PortAudio calls back from its own thread with each 1024-frame
+        block, so there is no Python read loop polling the device.  The
+        PyAudio instance and stream are opened on first use and only
+        paused between recordings, so later recordings skip device setup.
+        Returns False if the device can't be opened.
+        """
+        if not PYAUDIO_AVAILABLE:
             self._emit_status("PyAudio not installed")
-            self._recording = False
-            return
+            return False
 
-        audio = pyaudio.PyAudio()
+        self._capture_queue = audio_queue
+        if self._stream is not None:
+            try:
+                self._stream.start_stream()
+                return True
+            except Exception as exc:
+                # The device may have gone away; reopen it from scratch
+                log.warning("Restarting audio stream failed: %s", exc)
+                self.close()
+                self._capture_queue = audio_queue
+
+        def on_audio(in_data, _frame_count, _time_info, _status):
+            capture_queue = self._capture_queue
+            if capture_queue is not None:
+                _put_dropping_oldest(
+                    capture_queue, np.frombuffer(in_data, np.int16)
+                )
+            return (None, pyaudio.paContinue)
+
+        if self._pa is None:
+            self._pa = pyaudio.PyAudio()
         try:
-            stream = audio.open(
+            self._stream = self._pa.open(
                 format=pyaudio.paInt16,
                 channels=1,
-                rate=16000,
+                rate=SAMPLE_RATE,
                 input=True,
-                frames_per_buffer=1024,
+                frames_per_buffer=CHUNK_FRAMES,
+                stream_callback=on_audio,
             )
         except Exception as exc:
             self._emit_status(f"Audio error: {exc}")
-            audio.terminate()
+            self.close()
+            return False
+        return True
+
+    def _pause_stream(self):
+        """Stop capturing but keep the device open for the next recording.
+        Does nothing if capture is already paused."""
+        if self._capture_queue is None:
+            return
+        self._capture_queue = None
+        if self._stream is not None:
+            try:
+                self._stream.stop_stream()
+            except Exception as exc:
+                log.warning("Stopping audio stream failed: %s", exc)
+                self.close()
+
+    def close(self):
+        """Release the audio device.  Safe to call more than once."""
+        self._capture_queue = None
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception as exc:
+                log.debug("Closing audio stream failed: %s", exc)
+            self._stream = None
+        if self._pa is not None:
+            self._pa.terminate()
+            self._pa = None
+
+    def _worker_loop(self, stop_event, audio_queue, previous=None):
+        """Background worker: captures audio while loading the model, then
+        transcribes the queued audio until *stop_event* is set."""
+        # The ring buffer and stream are shared, so let the previous
+        # session finish
+        if previous is not None:
+            previous.join()
+
+        if not self._start_stream(audio_queue):
             self._recording = False
             return
-
-        window = []
-        transcribe_interval = 0.5
-        chunks_per_interval = int(16000 * transcribe_interval / 1024)
-        chunk_count = 0
-        prev_text = ""
-        stable_cycles = 0
-
         try:
-            while not self._stop_event.is_set():
-                try:
-                    data = stream.read(1024, exception_on_overflow=False)
-                except Exception:
-                    continue
-
-                window.append(data)
-                chunk_count += 1
-
-                if chunk_count >= chunks_per_interval and window:
-                    chunk_count = 0
-                    self._emit_status("Transcribing...")
-
-                    audio_data = b"".join(window)
-                    arr = (
-                        np.frombuffer(audio_data, np.int16)
-                        .flatten()
-                        .astype(np.float32)
-                        / 32768.0
-                    )
-
-                    try:
-                        result = self._model.transcribe(
-                            arr,
-                            fp16=False,
-                            language="en",
-                            temperature=0.1,
-                            logprob_threshold=-0.5,
-                        )
-                        text = result.get("text", "").strip()
-                    except Exception:
-                        text = ""
-
-                    if text:
-                        if text == prev_text:
-                            stable_cycles += 1
-                        else:
-                            stable_cycles = 0
-                            prev_text = text
-
-                        if stable_cycles >= 2:
-                            self._emit_transcript(
-                                {"is_partial": False, "data": {"text": text}}
-                            )
-                            self._route_final_text(text)
-                            window = []
-                            prev_text = ""
-                            stable_cycles = 0
-                        else:
-                            self._emit_transcript(
-                                {"is_partial": True, "data": {"text": text}}
-                            )
-
-                    self._emit_status("Recording...")
+            finished = self._transcribe_loop(stop_event, audio_queue)
         finally:
-            stream.stop_stream()
-            stream.close()
-            audio.terminate()
+            self._pause_stream()
+        if finished:
             self._emit_status("Ready")
+
+    def _transcribe_loop(self, stop_event, audio_queue):
+        """Returns False if no model could be loaded, True once stopped."""
+        if not self._wait_for_model(stop_event):
+            self._recording = False
+            return False
+
+        if not stop_event.is_set():
+            self._emit_status("Recording...")
+
+        self._ring_len = 0
+        segment_max_samples = SAMPLE_RATE * SEGMENT_MAX_SECONDS
+        pre_roll_samples = int(SAMPLE_RATE * PRE_ROLL_SECONDS)
+        # Passes run on the clock rather than on a chunk count, so the
+        # cadence is exactly TRANSCRIBE_INTERVAL whatever the block size
+        next_tick = time.monotonic() + TRANSCRIBE_INTERVAL
+        samples_since_commit = 0
+        samples_since_pass = 0
+        # Undecided words from the last pass, timed from the ring start
+        pending_words = []
+        prompt = ""
+
+        while not stop_event.is_set():
+            try:
+                chunk = audio_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            # Pick up everything captured while the last pass was running;
+            # None is the stop sentinel from stop_recording()
+            while chunk is not None:
+                self._ring_append(chunk)
+                samples_since_commit += chunk.shape[0]
+                samples_since_pass += chunk.shape[0]
+                try:
+                    chunk = audio_queue.get_nowait()
+                except queue.Empty:
+                    break
+            if chunk is None:
+                break
+
+            now = time.monotonic()
+            if now < next_tick:
+                continue
+            # A slow pass skips the ticks it overran instead of bursting
+            next_tick += TRANSCRIBE_INTERVAL
+            if next_tick <= now:
+                next_tick = now + TRANSCRIBE_INTERVAL
+
+            if samples_since_commit < MIN_DECODE_SAMPLES:
+                continue
+
+            # Energy gate over the audio that arrived since the last commit
+            # (at most the last second): no new speech means nothing new to
+            # decode, and any undecided words are now followed by silence,
+            # so they are final as they stand.
+            n = self._ring_len
+            new_audio = self._ring[n - min(samples_since_commit, n, SAMPLE_RATE) : n]
+            if _is_silent(new_audio):
+                if pending_words:
+                    prompt = self._commit_words(pending_words, prompt)
+                    self._ring_consume(int(pending_words[-1][1] * SAMPLE_RATE))
+                    pending_words = []
+                    samples_since_commit = 0
+                else:
+                    # A pause: drop the silence so the next voiced pass
+                    # doesn't decode it, and close the utterance
+                    self._ring_consume(n - pre_roll_samples)
+                    samples_since_commit = 0
+                    if self._utterance:
+                        self._end_segment()
+                continue
+
+            words = self._decode(n, prompt)
+            samples_since_pass = 0
+
+            split = _count_final_words(words, n / SAMPLE_RATE)
+            if not split and n >= segment_max_samples:
+                # Nothing settled in a full segment: commit all but the word
+                # at the buffer edge, which may be cut, to bound the decode
+                split = max(len(words) - 1, 0)
+                if not words:
+                    self._ring_consume(n - pre_roll_samples)
+                    samples_since_commit = 0
+            if split:
+                prompt = self._commit_words(words[:split], prompt)
+                self._ring_consume(int(words[split - 1][1] * SAMPLE_RATE))
+                samples_since_commit = 0
+            # Re-time the undecided words from the new ring start, so a
+            # later commit without decoding cuts in the right place
+            offset = words[split - 1][1] if split else 0.0
+            pending_words = [(word, end - offset) for word, end in words[split:]]
+            pending = "".join(word for word, _end in pending_words).strip()
+            if pending:
+                self._emit_transcript(True, pending)
+
+            if not stop_event.is_set():
+                self._emit_status("Recording...")
+
+        # Flush the end of the dictation: take in whatever is still queued,
+        # decode it if it is voiced audio the last pass did not see, and
+        # commit every word, undecided ones included
+        while True:
+            try:
+                chunk = audio_queue.get_nowait()
+            except queue.Empty:
+                break
+            if chunk is not None:
+                self._ring_append(chunk)
+                samples_since_pass += chunk.shape[0]
+        n = self._ring_len
+        partial_shown = bool(pending_words)
+        new_audio = self._ring[n - min(samples_since_pass, n, SAMPLE_RATE) : n]
+        if new_audio.size and not _is_silent(new_audio):
+            pending_words = self._decode(n, prompt)
+        self._commit_words(pending_words, prompt)
+        # A pause may already have closed the utterance
+        if self._utterance or partial_shown:
+            self._end_segment()
+        return True
@@ -1,5 +1,8 @@
 """Main application window with navigation split view"""
 
+import collections
+import threading
+
 import gi
 
 gi.require_version("Gtk", "4.0")
@@ -8,7 +11,12 @@ gi.require_version("Adw", "1")
 from gi.repository import Gtk, Adw, GLib, Pango  # noqa: E402
 
 from whisperflow.gui.recording import RecordingView
-from whisperflow.gui.settings import SettingsView
+from whisperflow.gui.settings import (
+    SettingsView,
+    apply_settings,
+    hotkey_keyval,
+    load_settings,
+)
 from whisperflow.gui.transcription_engine import TranscriptionEngine
 from whisperflow.gui.global_hotkey import GlobalHotkey
 
@@ -25,15 +33,34 @@ class WhisperFlowWindow(Adw.ApplicationWindow):
         )
 
         self.engine = TranscriptionEngine()
-        self.engine.connect_status(self._on_status_changed)
-        self.engine.connect_transcript(self._on_transcript_received)
+
+        # Engine events from worker threads, drained by one idle callback
+        self._gtk_thread_id = threading.get_ident()
+        self._pending = collections.deque()
+        self._pending_lock = threading.Lock()
+        self._idle_id = None
+
+        # Settings are applied up front; the settings page itself is only
+        # built the first time it is opened.
+        self.settings = load_settings()
+        apply_settings(self.engine, self.settings)
+        self._hotkey_keyval = hotkey_keyval(self.settings["hotkey"])
 
         # Global (system-wide) hotkey listener
         self._global_hotkey = GlobalHotkey()
 
         self._build_ui()
+
+        # The engine preloads its model in the background and may emit
+        # status from that thread, so only connect once the views exist.
+        self.engine.connect_status(self._on_status_changed)
+        self.engine.connect_transcript(self._on_transcript_received)
+        # Settings are applied by now, so this loads the saved model with
+        # the saved offline mode
+        self.engine.preload()
         self._setup_hotkey_controller()
         self._setup_global_hotkey()
+        self.connect("close-request", self._on_close_request)
 
     def _build_ui(self):
         # ── Sidebar navigation (fun icons) ─────────────────────
@@ -60,16 +87,15 @@ class WhisperFlowWindow(Adw.ApplicationWindow):
         sidebar_box.append(self.sidebar_list)
 
         # ── Content stack ──────────────────────────────────────
+        # No page transition: a crossfade paints both pages every frame
         self.content_stack = Gtk.Stack(
-            transition_type=Gtk.StackTransitionType.CROSSFADE,
-            transition_duration=200,
+            transition_type=Gtk.StackTransitionType.NONE,
         )
 
         self.recording_view = RecordingView(engine=self.engine)
-        self.settings_view = SettingsView(engine=self.engine)
+        self.settings_view = None
 
         self.content_stack.add_named(self.recording_view, "record")
-        self.content_stack.add_named(self.settings_view, "settings")
 
         content_header = Adw.HeaderBar(
             title_widget=Gtk.Label(label=""),
@@ -124,9 +150,29 @@ class WhisperFlowWindow(Adw.ApplicationWindow):
         self._navigate_to(row.nav_name, row.nav_title)
 
     def _navigate_to(self, name, title):
+        if name == "settings" and self.settings_view is None:
+            self.settings_view = SettingsView(
+                engine=self.engine,
+                settings=self.settings,
+                on_hotkey_changed=self._on_hotkey_changed,
+            )
+            self.content_stack.add_named(self.settings_view, "settings")
         self.content_stack.set_visible_child_name(name)
         self.content_title.set_label(title)
 
+    # ── Shutdown ───────────────────────────────────────────────
+
+    def _on_close_request(self, _window):
+        self.shutdown()
+        return False
+
+    def shutdown(self):
+        """Flush state that is written lazily and release the microphone.
+        Safe to call more than once."""
+        if self.settings_view is not None:
+            self.settings_view.flush_settings()
+        self.engine.close()
+
     # ── In-app hotkey (when window has focus) ──────────────────
 
     def _setup_hotkey_controller(self):
@@ -135,7 +181,7 @@ class WhisperFlowWindow(Adw.ApplicationWindow):
         self.add_controller(controller)
 
     def _on_key_pressed(self, _controller, keyval, _keycode, state):
-        hotkey = self.settings_view.get_hotkey_keyval()
+        hotkey = self._hotkey_keyval
         if hotkey and keyval == hotkey:
             self.recording_view.toggle_recording()
             return True
@@ -144,19 +190,77 @@ class WhisperFlowWindow(Adw.ApplicationWindow):
     # ── Global hotkey (system-wide, works when unfocused) ──────
 
     def _setup_global_hotkey(self):
-        key_name = self.settings_view.get_hotkey_name()
+        key_name = self.settings.get("hotkey", "F9")
         self._global_hotkey.set_hotkey(
             key_name, self._on_global_hotkey_pressed
         )
 
+    def _on_hotkey_changed(self, key_name):
+        self._hotkey_keyval = hotkey_keyval(key_name)
+        self._setup_global_hotkey()
+
     def _on_global_hotkey_pressed(self):
-        """Called from the pynput listener thread — bounce to GTK thread."""
-        GLib.idle_add(self.recording_view.toggle_recording)
+        """Called from the hotkey listener thread — bounce to GTK thread."""
+        self._call_on_gtk_thread(self.recording_view.toggle_recording)
+
+    def _call_on_gtk_thread(self, fn, *args):
+        if threading.get_ident() == self._gtk_thread_id:
+            fn(*args)
+        else:
+            GLib.idle_add(fn, *args)
 
     # ── Engine callbacks ───────────────────────────────────────
 
     def _on_status_changed(self, status):
-        GLib.idle_add(self.recording_view.set_status, status)
-
-    def _on_transcript_received(self, result):
-        GLib.idle_add(self.recording_view.append_transcript, result)
+        self._post("status", status)
+
+    def _on_transcript_received(self, is_partial, text):
+        self._post("partial" if is_partial else "final", text)
+
+    def _post(self, kind, payload):
+        """Queue an engine event; safe to call from any thread.
+
+        Events posted from the GTK thread itself (e.g. stop_recording's
+        status) are applied immediately, together with anything still
+        queued ahead of them so ordering is preserved.
+        """
+        on_gtk_thread = threading.get_ident() == self._gtk_thread_id
+        with self._pending_lock:
+            self._pending.append((kind, payload))
+            if on_gtk_thread:
+                if self._idle_id is not None:
+                    GLib.source_remove(self._idle_id)
+                    self._idle_id = None
+            elif self._idle_id is None:
+                self._idle_id = GLib.idle_add(
+                    self._drain_pending, priority=GLib.PRIORITY_DEFAULT_IDLE
+                )
+        if on_gtk_thread:
+            self._drain_pending()
+
+    def _drain_pending(self):
+        """Apply every queued engine event in one main-loop iteration."""
+        with self._pending_lock:
+            events = list(self._pending)
+            self._pending.clear()
+            self._idle_id = None
+
+        finals = []
+        partial = None
+        status = None
+        for kind, payload in events:
+            if kind == "status":
+                status = payload
+            elif kind == "final":
+                # A final (or a segment end, None) supersedes any partial
+                # that preceded it
+                finals.append(payload)
+                partial = None
+            else:
+                partial = payload
+
+        if finals or partial is not None:
+            self.recording_view.show_transcripts(finals, partial)
+        if status is not None:
+            self.recording_view.set_status(status)
+        return False
@@ -3,17 +3,80 @@
 Captures the currently active window (ID + title) so that when
 transcription completes, we can:
   1. Restore focus to that window
-  2. Type the transcribed text into whatever input had focus
+  2. Paste (or type) the transcribed text into whatever input had focus
 """
 
 import shutil
 import subprocess
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 log = logging.getLogger(__name__)
 
+try:
+    from Xlib import X, Xatom
+    from Xlib import display as xdisplay
 
-def _run(args, timeout=5):
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
+# Key chord used to paste into the focused window.  Ctrl+Shift+V pastes in
+# terminals and as plain text in most GUI toolkits, but some apps bind it
+# to something else (VS Code's Markdown preview, LibreOffice's Paste
+# Special), and xdotool succeeds either way, so pasting is opt-in.
+PASTE_KEYS = "ctrl+shift+v"
+
+# How long the target app gets to read the clipboard before the user's
+# previous clipboard contents are put back.
+CLIPBOARD_RESTORE_DELAY = 0.2
+
+# Read-only queries should answer instantly; anything slower means X is
+# stuck, so give up quickly instead of holding up the caller.
+QUERY_TIMEOUT = 0.5
+ACTION_TIMEOUT = 5
+
+# A window we activated moments ago is still in front; skip re-activating
+# it (windowactivate --sync waits for the window manager) within this TTL.
+FOCUS_CACHE_TTL = 2.0
+
+# Resolve helper binaries once; these are looked up on every transcript.
+_XDOTOOL = shutil.which("xdotool")
+_XCLIP = shutil.which("xclip")
+_XSEL = shutil.which("xsel")
+
+_CLIPBOARD_READ_CMDS = [
+    cmd
+    for cmd in (
+        [_XCLIP, "-o", "-selection", "clipboard"],
+        [_XSEL, "--clipboard", "--output"],
+    )
+    if cmd[0]
+]
+_CLIPBOARD_WRITE_CMDS = [
+    cmd
+    for cmd in (
+        [_XCLIP, "-selection", "clipboard"],
+        [_XSEL, "--clipboard", "--input"],
+    )
+    if cmd[0]
+]
+
+
+# Snapshots are taken on this worker so the GTK thread never waits on X
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="window-snapshot")
+
+# One X connection shared by all snapshots; python-xlib isn't thread-safe
+_DISPLAY = None
+_DISPLAY_LOCK = threading.Lock()
+
+# Last window focus_window() activated, and when
+_LAST_ACTIVATED = {"id": None, "ts": 0.0}
+
+
+def _run(args, timeout):
     """Run a subprocess and return stripped stdout, or None on failure."""
     try:
         result = subprocess.run(
@@ -24,48 +87,88 @@ def _run(args, timeout=5):
         )
         if result.returncode == 0:
             return result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as exc:
+    except subprocess.TimeoutExpired:
+        log.warning("Command %s timed out after %.1fs", args[:2], timeout)
+    except (FileNotFoundError, OSError) as exc:
         log.debug("Command %s failed: %s", args, exc)
     return None
 
 
+def _run_query(args):
+    """Run a read-only X query; a frozen X server costs at most QUERY_TIMEOUT."""
+    return _run(args, QUERY_TIMEOUT)
+
+
+def _run_action(args, timeout=ACTION_TIMEOUT):
+    """Run a command that acts on a window (focus, type, key)."""
+    return _run(args, timeout)
+
+
+def _valid_window_id(window_id):
+    """Return True if window_id looks like an X11 window ID."""
+    return bool(window_id) and str(window_id).isdigit()
+
+
+def _note_active_window(window_id):
+    """Drop the focus cache if another window is now active."""
+    if window_id != _LAST_ACTIVATED["id"]:
+        _LAST_ACTIVATED["id"] = None
+
+
 def is_available():
     """Return True if xdotool is installed."""
-    return shutil.which("xdotool") is not None
+    return _XDOTOOL is not None
 
 
 def get_active_window():
     """Return the X11 window ID of the currently focused window, or None."""
-    return _run(["xdotool", "getactivewindow"])
+    window_id = _run_query(["xdotool", "getactivewindow"])
+    _note_active_window(window_id)
+    return window_id
 
 
 def get_window_name(window_id):
     """Return the title of a given window ID."""
-    if not window_id:
+    if not _valid_window_id(window_id):
         return None
-    return _run(["xdotool", "getactivewindow", "getwindowname"])
+    return _run_query(["xdotool", "getwindowname", str(window_id)])
 
 
 def get_window_pid(window_id):
     """Return the PID of the process owning the window."""
-    if not window_id:
+    if not _valid_window_id(window_id):
         return None
-    return _run(["xdotool", "getwindowpid", str(window_id)])
+    return _run_query(["xdotool", "getwindowpid", str(window_id)])
 
 
 def focus_window(window_id):
     """Raise and focus a window by its X11 ID."""
-    if not window_id:
+    if not _valid_window_id(window_id):
         return False
-    result = _run(["xdotool", "windowactivate", "--sync", str(window_id)])
-    return result is not None
+    window_id = str(window_id)
+    # The user may have switched windows since; only skip the activation
+    # if a cheap active-window read still agrees.
+    if (
+        _LAST_ACTIVATED["id"] == window_id
+        and time.monotonic() - _LAST_ACTIVATED["ts"] < FOCUS_CACHE_TTL
+        and _active_window_id() == window_id
+    ):
+        return True
+    result = _run_action(["xdotool", "windowactivate", "--sync", window_id])
+    if result is None:
+        _LAST_ACTIVATED["id"] = None
+        return False
+    _LAST_ACTIVATED["id"] = window_id
+    _LAST_ACTIVATED["ts"] = time.monotonic()
+    return True
 
 
-def type_text(text, window_id=None, delay_ms=12):
+def type_text(text, window_id=None, delay_ms=0):
     """Type text into the currently focused window (or a specific window).
 
     Uses xdotool's --clearmodifiers to avoid modifier key interference.
-    The delay between keystrokes prevents dropped characters in some apps.
+    This is the fallback for when paste_text can't be used; pass a small
+    delay_ms for apps that drop characters when typed at full speed.
     """
     if not text:
         return False
@@ -80,49 +183,258 @@ def type_text(text, window_id=None, delay_ms=12):
         "--",
         text,
     ]
-    result = _run(args, timeout=max(10, len(text) * delay_ms / 1000 + 5))
+    result = _run_action(args, timeout=max(10, len(text) * delay_ms / 1000 + 5))
     return result is not None
 
 
+def get_clipboard():
+    """Return the current clipboard text (tries xclip, then xsel), or None."""
+    for cmd in _CLIPBOARD_READ_CMDS:
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=5,
+                check=True,
+            )
+            return result.stdout
+        except (subprocess.SubprocessError, OSError):
+            continue
+    return None
+
+
+def paste_text(text, window_id=None):
+    """Paste text into the focused window via the clipboard.
+
+    One synthetic key chord replaces a keystroke per character, so the
+    cost no longer grows with the length of the text.  The previous
+    clipboard contents are restored shortly afterwards.  Returns False if
+    no clipboard tool is available.
+    """
+    if not text:
+        return False
+    previous = get_clipboard()
+    if not set_clipboard(text):
+        return False
+
+    args = ["xdotool", "key"]
+    if window_id:
+        args += ["--window", str(window_id)]
+    args += ["--clearmodifiers", PASTE_KEYS]
+    ok = _run_action(args) is not None
+
+    if previous is not None and previous != text:
+        timer = threading.Timer(
+            CLIPBOARD_RESTORE_DELAY, set_clipboard, args=(previous,)
+        )
+        timer.daemon = True
+        timer.start()
+    return ok
+
+
 def set_clipboard(text):
     """Copy text to the system clipboard (tries xclip, then xsel)."""
-    for cmd in [
-        ["xclip", "-selection", "clipboard"],
-        ["xsel", "--clipboard", "--input"],
-    ]:
-        if shutil.which(cmd[0]):
-            try:
-                subprocess.run(
-                    cmd,
-                    input=text,
-                    text=True,
-                    timeout=5,
-                    check=True,
-                )
-                return True
-            except (subprocess.SubprocessError, OSError):
-                continue
+    for cmd in _CLIPBOARD_WRITE_CMDS:
+        try:
+            subprocess.run(
+                cmd,
+                input=text,
+                text=True,
+                timeout=5,
+                check=True,
+            )
+            return True
+        except (subprocess.SubprocessError, OSError):
+            continue
     return False
 
 
+def _xlib_text(prop):
+    if prop is None or not prop.value:
+        return None
+    value = prop.value
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return str(value)
+
+
+def _xlib_snapshot():
+    """Read (id, name, pid) of the active window from EWMH root properties.
+
+    Returns None if Xlib is unavailable or the X connection fails.
+    """
+    global _DISPLAY
+    if not XLIB_AVAILABLE:
+        return None
+    with _DISPLAY_LOCK:
+        try:
+            if _DISPLAY is None:
+                _DISPLAY = xdisplay.Display()
+            disp = _DISPLAY
+            atom = disp.intern_atom
+            root = disp.screen().root
+
+            active = root.get_full_property(
+                atom("_NET_ACTIVE_WINDOW"), X.AnyPropertyType
+            )
+            if active is None or not active.value or not active.value[0]:
+                return None, None, None
+            wid = int(active.value[0])
+            win = disp.create_resource_object("window", wid)
+
+            name = _xlib_text(
+                win.get_full_property(atom("_NET_WM_NAME"), atom("UTF8_STRING"))
+            )
+            if name is None:
+                name = _xlib_text(
+                    win.get_full_property(Xatom.WM_NAME, X.AnyPropertyType)
+                )
+            pid_prop = win.get_full_property(atom("_NET_WM_PID"), Xatom.CARDINAL)
+            pid = str(pid_prop.value[0]) if pid_prop and pid_prop.value else None
+            return str(wid), name, pid
+        except Exception as exc:
+            log.debug("Xlib window query failed: %s", exc)
+            _DISPLAY = None
+            return None
+
+
+def _xlib_active_window_id():
+    """Return the active window ID from _NET_ACTIVE_WINDOW.
+
+    Returns None if Xlib is unavailable or the X connection fails, and
+    "" if no window is active.
+    """
+    global _DISPLAY
+    if not XLIB_AVAILABLE:
+        return None
+    with _DISPLAY_LOCK:
+        try:
+            if _DISPLAY is None:
+                _DISPLAY = xdisplay.Display()
+            root = _DISPLAY.screen().root
+            active = root.get_full_property(
+                _DISPLAY.intern_atom("_NET_ACTIVE_WINDOW"), X.AnyPropertyType
+            )
+        except Exception as exc:
+            log.debug("Xlib active window query failed: %s", exc)
+            _DISPLAY = None
+            return None
+    if active is None or not active.value or not active.value[0]:
+        return ""
+    return str(int(active.value[0]))
+
+
+def _active_window_id():
+    """Return the active window ID over the shared X connection, falling
+    back to xdotool; None if neither can tell."""
+    window_id = _xlib_active_window_id()
+    if window_id is None:
+        window_id = _run_query(["xdotool", "getactivewindow"])
+    return window_id or None
+
+
+def _xdotool_snapshot():
+    """Read (id, name, pid) of the active window with a single xdotool run.
+
+    getactivewindow only prints the ID when it is the last command in a
+    chain, so the ID comes from getwindowgeometry --shell (WINDOW=...),
+    followed by the name and pid lines.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "xdotool",
+                "getactivewindow",
+                "getwindowgeometry", "--shell",
+                "getwindowname",
+                "getwindowpid",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=QUERY_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        log.warning("xdotool window query timed out after %.1fs", QUERY_TIMEOUT)
+        return None, None, None
+    except (FileNotFoundError, OSError) as exc:
+        log.debug("xdotool window query failed: %s", exc)
+        return None, None, None
+
+    # getwindowpid fails for windows without _NET_WM_PID, so parse
+    # whatever was printed before that even on a non-zero exit.
+    lines = result.stdout.splitlines()
+    window_id = None
+    rest = []
+    for idx, line in enumerate(lines):
+        if line.startswith("WINDOW="):
+            window_id = line.split("=", 1)[1] or None
+        elif line.startswith("SCREEN="):
+            rest = lines[idx + 1 :]
+            break
+    if window_id is None:
+        return None, None, None
+    name = rest[0] if len(rest) > 0 else None
+    pid = rest[1].strip() or None if len(rest) > 1 else None
+    return window_id, name, pid
+
+
+def capture_active_window():
+    """Return (id, name, pid) of the focused window; Xlib first, then xdotool."""
+    snapshot = _xlib_snapshot()
+    if snapshot is None:
+        snapshot = _xdotool_snapshot()
+    _note_active_window(snapshot[0])
+    return snapshot
+
+
 class WindowSnapshot:
-    """Captures the active window state at a point in time."""
+    """Captures the active window state at a point in time.
+
+    The query runs on a background worker; the attributes block until it
+    has finished, which in practice is long before text is typed back.
+    """
 
     def __init__(self):
-        self.window_id = get_active_window()
-        self.window_name = get_window_name(self.window_id)
-        self.window_pid = get_window_pid(self.window_id)
+        self._future = _EXECUTOR.submit(capture_active_window)
+
+    @property
+    def ready(self):
+        return self._future.done()
+
+    def add_done_callback(self, callback):
+        """Call ``callback(snapshot)`` once captured (possibly immediately,
+        otherwise from the worker thread)."""
+        self._future.add_done_callback(lambda _future: callback(self))
+
+    @property
+    def window_id(self):
+        return self._future.result()[0]
+
+    @property
+    def window_name(self):
+        return self._future.result()[1]
+
+    @property
+    def window_pid(self):
+        return self._future.result()[2]
 
     @property
     def valid(self):
         return self.window_id is not None
 
-    def restore_and_type(self, text):
-        """Bring the captured window back to front and type text into it."""
+    def restore_and_type(self, text, use_paste=False):
+        """Bring the captured window back to front and type text into it.
+
+        With *use_paste*, the text is pasted through the clipboard and only
+        typed keystroke by keystroke if pasting isn't possible.
+        """
         if not self.valid or not text:
             return False
         if not focus_window(self.window_id):
             return False
+        if use_paste and paste_text(text):
+            return True
         return type_text(text)
 
     def __repr__(self):